@@ -0,0 +1,121 @@
+"""
+Per-span citation parsing hot path
+
+Kept free of logging and fully annotated so it can be compiled with mypyc
+(``mypyc backend/_citation_fast.py``). The resulting extension module is
+imported in preference to this file; without it the pure-Python version
+below is used unchanged.
+"""
+import re
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+# Fused component pattern: U.S. Supreme Court (123 U.S. 456), Federal
+# Reporter (123 F.2d 456), state reporters (123 NE 456) and a generic
+# "123 Reporter 456" form, matched in one engine invocation
+_CITE_RE = re.compile(
+    r'(?P<vol>\d+)\s+'
+    r'(?:(?P<us>U\.S\.)\s+'
+    r'|(?P<fed>F\.(?:[234]d)?)\s+'
+    r'|(?P<state>[A-Z]{2})\.?\s+(?:[23]d)?\s+'
+    r'|(?P<gen>[A-Za-z]+)\.?\s+)'
+    r'(?P<page>\d+)'
+)
+
+@dataclass(slots=True, frozen=True)
+class ParsedCitation:
+    """Parsed citation data structure"""
+    raw_text: str
+    normalized_key: str
+    reporter: Optional[str] = None
+    volume: Optional[int] = None
+    page: Optional[int] = None
+    year: Optional[int] = None
+    page_number: Optional[int] = None
+    span_start: Optional[int] = None
+    span_end: Optional[int] = None
+    confidence: float = 0.0
+
+    # Dict-style access for callers written against the former dict results
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PARSED_CITATION_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _PARSED_CITATION_FIELDS
+
+_PARSED_CITATION_FIELDS = frozenset(field.name for field in fields(ParsedCitation))
+
+def extract_citation_components(text: str) -> Dict[str, Any]:
+    """Extract citation components from raw text"""
+    components: Dict[str, Any] = {}
+
+    # Every citation starts with a volume number, so spans that don't
+    # start with a digit can skip the regex engine entirely
+    text = text.lstrip()
+    if not text[:1].isdigit():
+        return components
+
+    # Single pass over the fused pattern; branch order mirrors the
+    # U.S. -> Federal -> State -> Generic precedence
+    match = _CITE_RE.match(text)
+    if match:
+        volume = int(match.group("vol"))
+        # Reporters come from a small closed set; the matched ones are
+        # interned so every citation shares one string per reporter
+        if match.group("us"):
+            reporter = "U.S."
+        elif match.group("fed"):
+            reporter = "F."
+        elif match.group("state"):
+            reporter = sys.intern(match.group("state"))
+        else:
+            reporter = sys.intern(match.group("gen"))
+        page = int(match.group("page"))
+
+        components["volume"] = volume
+        components["reporter"] = reporter
+        components["page"] = page
+        components["normalized_key"] = f"{volume} {reporter} {page}"
+
+    return components
+
+def create_normalized_key(components: Dict[str, Any]) -> str:
+    """Create a normalized key for the citation"""
+    parts = []
+
+    if components.get("volume"):
+        parts.append(str(components["volume"]))
+
+    if components.get("reporter"):
+        parts.append(components["reporter"])
+
+    if components.get("page"):
+        parts.append(str(components["page"]))
+
+    return " ".join(parts) if parts else "unknown"
+
+def parse_span(span: Dict[str, Any]) -> ParsedCitation:
+    """Parse a single citation span"""
+    raw_text = span.get("raw_text", "")
+
+    # Extract citation components using regex
+    citation_data = extract_citation_components(raw_text)
+
+    # Use the key built during extraction; fall back for partial data
+    normalized_key = citation_data.get("normalized_key") or create_normalized_key(citation_data)
+
+    return ParsedCitation(
+        raw_text=raw_text,
+        normalized_key=normalized_key,
+        reporter=citation_data.get("reporter"),
+        volume=citation_data.get("volume"),
+        page=citation_data.get("page"),
+        year=citation_data.get("year"),
+        page_number=span.get("page_number", 0),
+        span_start=span.get("span_start", 0),
+        span_end=span.get("span_end", 0),
+        confidence=span.get("confidence", 0.0)
+    )
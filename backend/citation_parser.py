@@ -2,25 +2,46 @@
 Citation parsing service for extracted citation spans
 """
 import structlog
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 import re
 
+from backend._citation_fast import (
+    ParsedCitation,
+    create_normalized_key,
+    extract_citation_components,
+    parse_span,
+)
+
 logger = structlog.get_logger()
 
-@dataclass
-class ParsedCitation:
-    """Parsed citation data structure"""
-    raw_text: str
-    normalized_key: str
-    reporter: str = None
-    volume: int = None
-    page: int = None
-    year: int = None
-    page_number: int = None
-    span_start: int = None
-    span_end: int = None
-    confidence: float = 0.0
+# Citation patterns, compiled once at import time
+_US_RE = re.compile(r'(\d+)\s+U\.S\.\s+(\d+)')
+_FED_RE = re.compile(r'(\d+)\s+F\.(?:[234]d)?\s+(\d+)')
+_STATE_RE = re.compile(r'(\d+)\s+([A-Z]{2})\.?\s+(?:[23]d)?\s+(\d+)')
+
+# Every citation starts with a volume number; texts without a digit can't match
+_DIGIT_RE = re.compile(r'\d')
+
+# Patterns used by the raw-text fallback in parse_citations
+_FALLBACK_PATTERNS = [_US_RE, _FED_RE, _STATE_RE]
+
+# Distinct texts whose fallback parse is kept for reuse
+_FALLBACK_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_FALLBACK_CACHE_SIZE)
+def _parse_fallback(text: str) -> Tuple[ParsedCitation, ...]:
+    """Regex fallback parse, memoized since it depends only on the text"""
+    # This is a simplified fallback - in production you'd use eyecite
+    citations = []
+    append = citations.append
+    
+    for pattern in _FALLBACK_PATTERNS:
+        for match in pattern.finditer(text):
+            raw_text = match.group(0)
+            append(ParsedCitation(raw_text, raw_text, confidence=0.6))
+    
+    return tuple(citations)
 
 class CitationParser:
     """Citation parsing service"""
@@ -58,83 +79,15 @@ class CitationParser:
     
     def _parse_single_citation(self, span: Dict) -> ParsedCitation:
         """Parse a single citation span"""
-        raw_text = span.get("raw_text", "")
-        page_number = span.get("page_number", 0)
-        span_start = span.get("span_start", 0)
-        span_end = span.get("span_end", 0)
-        confidence = span.get("confidence", 0.0)
-        
-        # Extract citation components using regex
-        citation_data = self._extract_citation_components(raw_text)
-        
-        # Create normalized key
-        normalized_key = self._create_normalized_key(citation_data)
-        
-        return ParsedCitation(
-            raw_text=raw_text,
-            normalized_key=normalized_key,
-            reporter=citation_data.get("reporter"),
-            volume=citation_data.get("volume"),
-            page=citation_data.get("page"),
-            year=citation_data.get("year"),
-            page_number=page_number,
-            span_start=span_start,
-            span_end=span_end,
-            confidence=confidence
-        )
+        return parse_span(span)
     
     def _extract_citation_components(self, text: str) -> Dict[str, Any]:
         """Extract citation components from raw text"""
-        components = {}
-        
-        # U.S. Supreme Court: 123 U.S. 456
-        us_match = re.match(r'(\d+)\s+U\.S\.\s+(\d+)', text)
-        if us_match:
-            components["volume"] = int(us_match.group(1))
-            components["reporter"] = "U.S."
-            components["page"] = int(us_match.group(2))
-            return components
-        
-        # Federal Reporter: 123 F.2d 456
-        fed_match = re.match(r'(\d+)\s+F\.(?:2d|3d|4d)?\s+(\d+)', text)
-        if fed_match:
-            components["volume"] = int(fed_match.group(1))
-            components["reporter"] = "F."
-            components["page"] = int(fed_match.group(2))
-            return components
-        
-        # State cases: 123 N.E.2d 456
-        state_match = re.match(r'(\d+)\s+([A-Z]{2})\.?\s+(?:2d|3d)?\s+(\d+)', text)
-        if state_match:
-            components["volume"] = int(state_match.group(1))
-            components["reporter"] = state_match.group(2)
-            components["page"] = int(state_match.group(3))
-            return components
-        
-        # Generic pattern: 123 Reporter 456
-        generic_match = re.match(r'(\d+)\s+([A-Za-z]+)\.?\s+(\d+)', text)
-        if generic_match:
-            components["volume"] = int(generic_match.group(1))
-            components["reporter"] = generic_match.group(2)
-            components["page"] = int(generic_match.group(3))
-            return components
-        
-        return components
+        return extract_citation_components(text)
     
     def _create_normalized_key(self, components: Dict[str, Any]) -> str:
         """Create a normalized key for the citation"""
-        parts = []
-        
-        if components.get("volume"):
-            parts.append(str(components["volume"]))
-        
-        if components.get("reporter"):
-            parts.append(components["reporter"])
-        
-        if components.get("page"):
-            parts.append(str(components["page"]))
-        
-        return " ".join(parts) if parts else "unknown"
+        return create_normalized_key(components)
     
     def parse_citations(self, text: str) -> List[ParsedCitation]:
         """
@@ -146,25 +99,34 @@ class CitationParser:
         Returns:
             List of parsed citations
         """
-        # This is a simplified fallback - in production you'd use eyecite
-        citations = []
+        # Prose without any digit skips the citation patterns and the cache
+        if not _DIGIT_RE.search(text):
+            return []
+        
+        # Cached citations are shared between callers; the list is a fresh copy
+        return list(_parse_fallback(text))
+    
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop memoized fallback parses"""
+        _parse_fallback.cache_clear()
+    
+    def parse_citations_batch(self, texts: List[str]) -> List[List[ParsedCitation]]:
+        """
+        Parse citations from many raw texts, parsing each distinct text once
         
-        # Basic citation patterns
-        patterns = [
-            r'(\d+)\s+U\.S\.\s+(\d+)',
-            r'(\d+)\s+F\.(?:2d|3d|4d)?\s+(\d+)',
-            r'(\d+)\s+[A-Z]{2}\.?\s+(?:2d|3d)?\s+(\d+)',
-        ]
+        Args:
+            texts: Raw texts to search for citations
+            
+        Returns:
+            One list of parsed citations per input text, in input order
+        """
+        # Repeated passages (boilerplate, recurring citation strings) are
+        # parsed once and their results shared by every occurrence
+        parsed = {text: self.parse_citations(text) for text in dict.fromkeys(texts)}
         
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                citation = ParsedCitation(
-                    raw_text=match.group(0),
-                    normalized_key=match.group(0),
-                    confidence=0.6
-                )
-                citations.append(citation)
+        self.logger.info("Batch citation parsing completed",
+                        input_texts=len(texts),
+                        unique_texts=len(parsed))
         
-        return citations
-
+        return [list(parsed[text]) for text in texts]
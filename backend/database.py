@@ -1,7 +1,7 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import os
@@ -12,6 +12,10 @@ load_dotenv()
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/citations.db")
 
+# Connection pool sizing for server databases (ignored for SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 25))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 25))
+
 # Create engine with appropriate settings
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
@@ -20,8 +24,24 @@ if DATABASE_URL.startswith("sqlite"):
         poolclass=StaticPool,
         echo=False  # Set to True for SQL debugging
     )
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune SQLite for the ingest workload (bulk inserts, large joins)"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.close()
 else:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -33,8 +53,30 @@ def get_db():
     finally:
         db.close()
 
+def warm_pool():
+    """Open the pool's connections up front so early requests don't pay for connect"""
+    # SQLite runs on a StaticPool with a single shared connection
+    size = 1 if DATABASE_URL.startswith("sqlite") else DB_POOL_SIZE
+    connections = []
+    try:
+        # Hold every connection until all are open so the pool creates
+        # distinct ones instead of handing back the same connection
+        for _ in range(size):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+
 def create_tables():
     """Create all tables"""
     from backend.models import Base
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips tables that already exist, so add any indexes
+    # introduced after the database was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
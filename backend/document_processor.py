@@ -1,20 +1,47 @@
 """
 Document processing service that orchestrates PDF processing and citation parsing
 """
-import os
 import hashlib
+import os
+import re
 import structlog
-from typing import List, Dict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
-import pdfplumber
+from blake3 import blake3
 
-from backend.pdf_processor import PDFProcessor
+from backend.pdf_processor import PDFProcessor, WORKER_MP_CONTEXT
 from backend.citation_parser import CitationParser, ParsedCitation
-from backend.models import Document as DocumentModel, Citation as CitationModel
+from backend.models import Document as DocumentModel, Citation as CitationModel, FileFingerprint, uuid7
 from backend.database import SessionLocal
 
 logger = structlog.get_logger()
 
+# Legal document title patterns
+_TITLE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # Look for lines that look like case titles
+        r'^[A-Z][A-Za-z\s&,\-\'\.]+(?:v\.|vs\.|versus)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
+        # Look for lines with "IN RE" or "IN THE MATTER OF"
+        r'^(?:IN RE|IN THE MATTER OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
+        # Look for lines with "UNITED STATES" or "STATE OF"
+        r'^(?:UNITED STATES|STATE OF|COMMONWEALTH OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
+        # Look for lines with "PEOPLE OF" or "CITY OF"
+        r'^(?:PEOPLE OF|CITY OF|COUNTY OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$'
+    )
+]
+
+# Line prefixes that mark page furniture rather than a title
+_TITLE_SKIP_PREFIXES = ('Page', 'Date', 'Docket', 'Case', 'No.', 'Filed', 'Decided')
+_FALLBACK_TITLE_SKIP_PREFIXES = _TITLE_SKIP_PREFIXES + ('Before', 'Opinion')
+
+# (reporter, volume, page) keys per candidate query while linking; three
+# bound parameters each, well under SQLite's variable limit
+LINK_KEY_BATCH_SIZE = 500
+
 class DocumentProcessor:
     """
     Main document processing service following cursor/ai/extraction.pipeline.md
@@ -25,69 +52,70 @@ class DocumentProcessor:
         self.citation_parser = CitationParser()
         self.logger = logger.bind(component="document_processor")
     
-    def _extract_document_title(self, file_path: str) -> str:
-        """Extract document title from PDF content instead of filename"""
+    def _extract_document_title(self, file_path: str,
+                                title_texts: Optional[Tuple[str, str]] = None) -> str:
+        """
+        Extract document title from PDF content instead of filename
+        
+        Args:
+            file_path: Path to the PDF
+            title_texts: (title region, full page) text of the first page, when
+                the caller has already extracted it; read from file_path otherwise
+        """
         try:
-            # Extract first page text to find title
-            with pdfplumber.open(file_path) as pdf:
-                if pdf.pages:
-                    first_page = pdf.pages[0]
-                    text = first_page.extract_text() or ""
-                    
-                    # Look for title patterns in first page
-                    lines = text.split('\n')
-                    
-                    # Legal document title patterns
-                    title_patterns = [
-                        # Look for lines that look like case titles
-                        r'^[A-Z][A-Za-z\s&,\-\'\.]+(?:v\.|vs\.|versus)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
-                        # Look for lines with "IN RE" or "IN THE MATTER OF"
-                        r'^(?:IN RE|IN THE MATTER OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
-                        # Look for lines with "UNITED STATES" or "STATE OF"
-                        r'^(?:UNITED STATES|STATE OF|COMMONWEALTH OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$',
-                        # Look for lines with "PEOPLE OF" or "CITY OF"
-                        r'^(?:PEOPLE OF|CITY OF|COUNTY OF)\s+[A-Z][A-Za-z\s&,\-\'\.]+$'
-                    ]
-                    
-                    import re
-                    
-                    # Try to find a title using patterns
-                    for line in lines[:15]:  # Check first 15 lines
-                        line = line.strip()
-                        if line and len(line) > 15 and len(line) < 300:  # Reasonable title length
-                            # Check if line matches any title pattern
-                            for pattern in title_patterns:
-                                if re.match(pattern, line, re.IGNORECASE):
-                                    return line
-                            
-                            # Check if line looks like a title (starts with capital, has reasonable length)
-                            if (line[0].isupper() and 
-                                not line.startswith('Page') and 
-                                not line.startswith('Date') and
-                                not line.startswith('Docket') and
-                                not line.startswith('Case') and
-                                not line.startswith('No.') and
-                                not line.startswith('Filed') and
-                                not line.startswith('Decided')):
-                                return line
-                    
-                    # Fallback: use first non-empty line that looks like a title
-                    for line in lines:
-                        line = line.strip()
-                        if (line and len(line) > 10 and len(line) < 200 and 
-                            line[0].isupper() and 
-                            not any(line.startswith(x) for x in ['Page', 'Date', 'Docket', 'Case', 'No.', 'Filed', 'Decided', 'Before', 'Opinion'])):
-                            return line[:150]  # Limit length
-                    
-                    # Last resort: use filename without extension
-                    return os.path.basename(file_path).replace('.pdf', '')
-                    
+            if title_texts is None:
+                title_texts = self.pdf_processor.extract_title_texts(file_path)
+            # The title sits near the top of the page, so search the top
+            # of the first page and widen to the full page if nothing is found
+            header_text, page_text = title_texts
+            title = self._find_title_in_text(header_text) or self._find_title_in_text(page_text)
+            if title:
+                return title
         except Exception as e:
             self.logger.warning("Failed to extract title from PDF", file_path=file_path, error=str(e))
-            # Fallback to filename
-            return os.path.basename(file_path).replace('.pdf', '')
+        
+        # Last resort: use filename without extension
+        return os.path.basename(file_path).replace('.pdf', '')
     
-    def process_document(self, document_id: str) -> Dict:
+    def extract_titles(self, file_paths: List[str]) -> List[str]:
+        """Extract titles for many PDFs, spread across worker processes"""
+        if not file_paths:
+            return []
+        
+        max_workers = min(_processing_workers(), len(file_paths))
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=WORKER_MP_CONTEXT) as executor:
+            return list(executor.map(_extract_title_worker, file_paths))
+    
+    def _find_title_in_text(self, text: str) -> Optional[str]:
+        """Find a title-like line in first page text"""
+        # Look for title patterns in the text
+        lines = text.split('\n')
+        
+        # Try to find a title using patterns
+        for line in lines[:15]:  # Check first 15 lines
+            line = line.strip()
+            if line and len(line) > 15 and len(line) < 300:  # Reasonable title length
+                # Check if line matches any title pattern
+                if any(pattern.match(line) for pattern in _TITLE_PATTERNS):
+                    return line
+                
+                # Check if line looks like a title (starts with capital, has reasonable length)
+                if line[0].isupper() and not line.startswith(_TITLE_SKIP_PREFIXES):
+                    return line
+        
+        # Fallback: use first non-empty line that looks like a title
+        for line in lines:
+            line = line.strip()
+            if (line and len(line) > 10 and len(line) < 200 and 
+                line[0].isupper() and 
+                not line.startswith(_FALLBACK_TITLE_SKIP_PREFIXES)):
+                return line[:150]  # Limit length
+        
+        return None
+    
+    def process_document(self, document_id: str, extract_title: bool = False,
+                         parallel_pages: bool = False) -> Dict:
         """
         Process a document through the complete pipeline:
         1) PDF Text extraction
@@ -97,6 +125,10 @@ class DocumentProcessor:
         
         Args:
             document_id: UUID of document to process
+            extract_title: Set the title from the first page text extracted
+                in step 1, instead of opening the PDF a second time
+            parallel_pages: Extract pages across worker processes; leave off
+                when documents are already being processed in parallel
             
         Returns:
             Processing results summary
@@ -110,35 +142,12 @@ class DocumentProcessor:
             if not document:
                 raise ValueError(f"Document not found: {document_id}")
             
-            if not document.source_path or not os.path.exists(document.source_path):
-                raise ValueError(f"PDF file not found: {document.source_path}")
-            
-            # Step 1: Extract PDF text
-            pdf_result = self.pdf_processor.process_pdf(document.source_path)
-            
-            # Step 2: Parse citations
-            parsed_citations = self.citation_parser.parse_citations_from_spans(
-                pdf_result["citations"]
+            extracted = self._extract_document(
+                document.source_path,
+                extract_title=extract_title,
+                max_workers=_processing_workers() if parallel_pages else 1
             )
-            
-            # Step 3: Store citations in database
-            stored_citations = self._store_citations(db, document_id, parsed_citations)
-            
-            # Step 4: Basic candidate linking (simplified)
-            linked_citations = self._link_citations(db, stored_citations)
-            
-            result = {
-                "document_id": document_id,
-                "pdf_pages": pdf_result["total_pages"],
-                "pdf_chars": pdf_result["total_chars"],
-                "citations_found": len(parsed_citations),
-                "citations_stored": len(stored_citations),
-                "citations_linked": linked_citations,
-                "processing_status": "completed"
-            }
-            
-            self.logger.info("Document processing completed", **result)
-            return result
+            return self._store_document(db, document, extracted)
             
         except Exception as e:
             self.logger.error("Document processing failed", 
@@ -148,35 +157,118 @@ class DocumentProcessor:
         finally:
             db.close()
     
+    def _extract_document(self, source_path: Optional[str], extract_title: bool = False,
+                          max_workers: int = 1) -> Dict:
+        """
+        Steps 1-2 of the pipeline: extract PDF text and parse citations.
+        Touches no database state, so it is safe to run in worker processes
+        """
+        if not source_path or not os.path.exists(source_path):
+            raise ValueError(f"PDF file not found: {source_path}")
+        
+        # Step 1: Extract PDF text
+        pdf_result = self.pdf_processor.process_pdf(source_path, max_workers=max_workers)
+        
+        title = None
+        if extract_title:
+            first_page_text = next(
+                (page["text"] for page in pdf_result["page_texts"] if page["page_number"] == 1),
+                ""
+            )
+            # Same extractor as the update-titles endpoint, fed the text
+            # this pass already extracted
+            title = self._extract_document_title(
+                source_path, (pdf_result["title_region_text"], first_page_text)
+            )
+        
+        # Step 2: Parse citations
+        parsed_citations = self.citation_parser.parse_citations_from_spans(
+            pdf_result["citations"]
+        )
+        
+        return {
+            "pdf_pages": pdf_result["total_pages"],
+            "pdf_chars": pdf_result["total_chars"],
+            "title": title,
+            "citations": parsed_citations
+        }
+    
+    def _store_document(self, db: Session, document: DocumentModel, extracted: Dict) -> Dict:
+        """Steps 3-4 of the pipeline: store citations and link them"""
+        document_id = document.id
+        if extracted["title"] and extracted["title"] != document.title:
+            document.title = extracted["title"]
+            db.commit()
+        
+        parsed_citations = extracted["citations"]
+        
+        # Step 3: Store citations in database
+        stored_citations = self._store_citations(db, document_id, parsed_citations)
+        
+        # Step 4: Basic candidate linking (simplified)
+        linked_citations = self._link_citations(db, stored_citations)
+        
+        result = {
+            "document_id": document_id,
+            "pdf_pages": extracted["pdf_pages"],
+            "pdf_chars": extracted["pdf_chars"],
+            "citations_found": len(parsed_citations),
+            "citations_stored": len(stored_citations),
+            "citations_linked": linked_citations,
+            "processing_status": "completed"
+        }
+        
+        self.logger.info("Document processing completed", **result)
+        return result
+    
+    def _replace_provisional_title(self, db: Session, document: DocumentModel):
+        """Give a new document whose processing failed its extracted title
+        instead of the provisional filename"""
+        try:
+            title = self._extract_document_title(document.source_path)
+            if title != document.title:
+                document.title = title
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            self.logger.warning("Failed to set document title", doc_id=document.id, error=str(e))
+    
     def _store_citations(self, db: Session, from_doc_id: str, 
                         parsed_citations: List[ParsedCitation]) -> List[CitationModel]:
         """Store parsed citations in database"""
-        stored_citations = []
+        if not parsed_citations:
+            return []
         
-        for parsed in parsed_citations:
-            citation = CitationModel(
-                from_doc_id=from_doc_id,
-                raw_text=parsed.raw_text,
-                normalized_key=parsed.normalized_key,
-                reporter=parsed.reporter,
-                volume=parsed.volume,
-                page=parsed.page,
-                year=parsed.year,
-                page_number=parsed.page_number,
-                span_start=parsed.span_start,
-                span_end=parsed.span_end,
-                confidence=parsed.confidence,
-                resolution_notes="[]"  # Empty JSON array
-            )
-            
-            db.add(citation)
-            stored_citations.append(citation)
+        # Ids are generated up front so the batch needs no per-row
+        # default and no RETURNING round trip
+        rows = [
+            {
+                "id": uuid7(),
+                "from_doc_id": from_doc_id,
+                "raw_text": parsed.raw_text,
+                "normalized_key": parsed.normalized_key,
+                "reporter": parsed.reporter,
+                "volume": parsed.volume,
+                "page": parsed.page,
+                "year": parsed.year,
+                "page_number": parsed.page_number,
+                "span_start": parsed.span_start,
+                "span_end": parsed.span_end,
+                "confidence": parsed.confidence,
+                "resolution_notes": "[]"  # Empty JSON array
+            }
+            for parsed in parsed_citations
+        ]
         
+        # Single executemany INSERT instead of one INSERT per row
+        db.execute(insert(CitationModel), rows)
         db.commit()
+        citation_ids = [row["id"] for row in rows]
         
-        # Refresh to get IDs
-        for citation in stored_citations:
-            db.refresh(citation)
+        # Reload all new rows in one SELECT rather than refreshing each row
+        stored_citations = db.scalars(
+            select(CitationModel).where(CitationModel.id.in_(citation_ids))
+        ).all()
         
         self.logger.info("Citations stored", 
                         document_id=from_doc_id,
@@ -190,28 +282,52 @@ class DocumentProcessor:
         This is a one-time intensive process that will be stored in the database
         """
         linked_count = 0
+        # New link rows, written with one executemany after the loop
+        pending_links = []
+        # (from_doc_id, to_doc_id, reporter, volume, page) already queued, so
+        # repeated citations of the same case don't insert duplicate links
+        seen_links = set()
+        
+        # Only citations with reporter, volume and page can be linked
+        complete = [c for c in citations if c.reporter and c.volume and c.page]
+        if not complete:
+            return 0
         
-        # Get all documents for cross-referencing
-        all_documents = db.query(DocumentModel).all()
+        total_documents = db.scalar(select(func.count()).select_from(DocumentModel))
         self.logger.info("Processing citations across all documents", 
-                        total_documents=len(all_documents),
+                        total_documents=total_documents,
                         total_citations=len(citations))
         
-        for citation in citations:
-            if not all([citation.reporter, citation.volume, citation.page]):
-                continue  # Skip incomplete citations
-            
-            # Find ALL candidate documents with matching citations
-            candidates = db.query(DocumentModel).join(CitationModel).filter(
-                CitationModel.reporter == citation.reporter,
-                CitationModel.volume == citation.volume,
-                CitationModel.page == citation.page,
-                CitationModel.from_doc_id != citation.from_doc_id  # Don't link to self
+        # Index the existing citations of every (reporter, volume, page) this
+        # batch cites, so candidate lookup is an in-memory dict probe instead
+        # of a query per citation. Only those keys are read (through
+        # ix_citation_rvp), not the whole table for every document
+        candidate_index = defaultdict(list)
+        keys = list({(c.reporter, c.volume, c.page) for c in complete})
+        for start in range(0, len(keys), LINK_KEY_BATCH_SIZE):
+            rows = db.execute(
+                select(CitationModel.reporter, CitationModel.volume,
+                       CitationModel.page, CitationModel.from_doc_id)
+                .where(tuple_(CitationModel.reporter, CitationModel.volume,
+                              CitationModel.page).in_(keys[start:start + LINK_KEY_BATCH_SIZE]))
+                .order_by(CitationModel.id)
             ).all()
+            for reporter, volume, page, doc_id in rows:
+                doc_ids = candidate_index[(reporter, volume, page)]
+                if doc_id not in doc_ids:
+                    doc_ids.append(doc_id)
+        
+        for citation in complete:
+            # Find ALL candidate documents with matching citations
+            candidates = [
+                doc_id
+                for doc_id in candidate_index[(citation.reporter, citation.volume, citation.page)]
+                if doc_id != citation.from_doc_id  # Don't link to self
+            ]
             
             if len(candidates) == 1:
                 # Exact match - high confidence link
-                citation.to_doc_id = candidates[0].id
+                citation.to_doc_id = candidates[0]
                 citation.confidence = min(citation.confidence + 0.3, 1.0)
                 citation.resolution_notes = '["Exact reporter/volume/page match"]'
                 linked_count += 1
@@ -219,29 +335,34 @@ class DocumentProcessor:
             elif len(candidates) > 1:
                 # Multiple candidates - create links to ALL matching documents
                 # This creates a network of connections
-                for candidate in candidates:
+                for candidate_id in candidates:
                     # Create additional citation records for multiple connections
-                    if candidate.id != citation.to_doc_id:  # Avoid duplicates
-                        additional_citation = CitationModel(
-                            from_doc_id=citation.from_doc_id,
-                            to_doc_id=candidate.id,
-                            raw_text=citation.raw_text,
-                            normalized_key=citation.normalized_key,
-                            reporter=citation.reporter,
-                            volume=citation.volume,
-                            page=citation.page,
-                            year=citation.year,
-                            page_number=citation.page_number,
-                            span_start=citation.span_start,
-                            span_end=citation.span_end,
-                            confidence=max(citation.confidence - 0.2, 0.1),
-                            resolution_notes=f'["Multiple candidates ({len(candidates)}), network connection"]'
-                        )
-                        db.add(additional_citation)
+                    if candidate_id != citation.to_doc_id:  # Avoid duplicates
+                        link_key = (citation.from_doc_id, candidate_id,
+                                    citation.reporter, citation.volume, citation.page)
+                        if link_key in seen_links:
+                            continue
+                        seen_links.add(link_key)
+                        pending_links.append({
+                            "id": uuid7(),
+                            "from_doc_id": citation.from_doc_id,
+                            "to_doc_id": candidate_id,
+                            "raw_text": citation.raw_text,
+                            "normalized_key": citation.normalized_key,
+                            "reporter": citation.reporter,
+                            "volume": citation.volume,
+                            "page": citation.page,
+                            "year": citation.year,
+                            "page_number": citation.page_number,
+                            "span_start": citation.span_start,
+                            "span_end": citation.span_end,
+                            "confidence": max(citation.confidence - 0.2, 0.1),
+                            "resolution_notes": f'["Multiple candidates ({len(candidates)}), network connection"]'
+                        })
                         linked_count += 1
                 
                 # Set primary link to first candidate
-                citation.to_doc_id = candidates[0].id
+                citation.to_doc_id = candidates[0]
                 citation.confidence = max(citation.confidence - 0.2, 0.1)
                 citation.resolution_notes = f'["Multiple candidates ({len(candidates)}), primary connection"]'
                 linked_count += 1
@@ -252,106 +373,170 @@ class DocumentProcessor:
                 if fuzzy_candidates:
                     # Create lower confidence connections for fuzzy matches
                     for candidate in fuzzy_candidates:
-                        fuzzy_citation = CitationModel(
-                            from_doc_id=citation.from_doc_id,
-                            to_doc_id=candidate.id,
-                            raw_text=citation.raw_text,
-                            normalized_key=citation.normalized_key,
-                            reporter=citation.reporter,
-                            volume=citation.volume,
-                            page=citation.page,
-                            year=citation.year,
-                            page_number=citation.page_number,
-                            span_start=citation.span_start,
-                            span_end=citation.span_end,
-                            confidence=0.3,  # Lower confidence for fuzzy matches
-                            resolution_notes='["Fuzzy citation match - potential connection"]'
-                        )
-                        db.add(fuzzy_citation)
+                        link_key = (citation.from_doc_id, candidate.id,
+                                    citation.reporter, citation.volume, citation.page)
+                        if link_key in seen_links:
+                            continue
+                        seen_links.add(link_key)
+                        pending_links.append({
+                            "id": uuid7(),
+                            "from_doc_id": citation.from_doc_id,
+                            "to_doc_id": candidate.id,
+                            "raw_text": citation.raw_text,
+                            "normalized_key": citation.normalized_key,
+                            "reporter": citation.reporter,
+                            "volume": citation.volume,
+                            "page": citation.page,
+                            "year": citation.year,
+                            "page_number": citation.page_number,
+                            "span_start": citation.span_start,
+                            "span_end": citation.span_end,
+                            "confidence": 0.3,  # Lower confidence for fuzzy matches
+                            "resolution_notes": '["Fuzzy citation match - potential connection"]'
+                        })
                         linked_count += 1
         
+        if pending_links:
+            db.execute(insert(CitationModel), pending_links)
         db.commit()
         
         self.logger.info("Enhanced citation linking completed", 
                         total_links_created=linked_count,
-                        documents_processed=len(all_documents))
+                        documents_processed=total_documents)
         return linked_count
     
     def _find_fuzzy_citations(self, db: Session, citation: CitationModel) -> List[DocumentModel]:
         """Find potential fuzzy matches for citations"""
-        candidates = []
+        if not citation.reporter or not citation.volume:
+            return []
         
-        if citation.reporter:
-            # Look for documents with same reporter but different volume/page
-            similar_citations = db.query(DocumentModel).join(CitationModel).filter(
+        # Documents citing the same reporter within 10 volumes, resolved in
+        # one query instead of scanning each document's citations in Python
+        doc_ids = db.scalars(
+            select(CitationModel.from_doc_id).distinct().where(
                 CitationModel.reporter == citation.reporter,
-                CitationModel.from_doc_id != citation.from_doc_id
-            ).all()
-            
-            for doc in similar_citations:
-                # Check if this document has citations that might be related
-                doc_citations = db.query(CitationModel).filter(
-                    CitationModel.from_doc_id == doc.id
-                ).all()
-                
-                for doc_citation in doc_citations:
-                    # If both citations reference the same case type, create connection
-                    if (doc_citation.reporter == citation.reporter and 
-                        doc_citation.volume and citation.volume and
-                        abs(doc_citation.volume - citation.volume) <= 10):  # Within 10 volumes
-                        candidates.append(doc)
-                        break
+                CitationModel.from_doc_id != citation.from_doc_id,
+                func.abs(CitationModel.volume - citation.volume) <= 10
+            )
+        ).all()
+        if not doc_ids:
+            return []
         
-        return list(set(candidates))  # Remove duplicates
+        return db.query(DocumentModel).filter(DocumentModel.id.in_(doc_ids)).all()
     
     def process_all_documents(self) -> Dict:
         """Process all documents that haven't been processed yet"""
         db = SessionLocal()
+        new_document_ids = set()
         try:
             # First, add any new PDFs from the data/pdfs folder
             pdf_storage_path = os.getenv("PDF_STORAGE_PATH", "./data/pdfs")
             if os.path.exists(pdf_storage_path):
-                pdf_files = [f for f in os.listdir(pdf_storage_path) if f.lower().endswith('.pdf')]
+                with os.scandir(pdf_storage_path) as entries:
+                    pdf_entries = [
+                        entry for entry in entries
+                        if entry.is_file() and entry.name.lower().endswith('.pdf')
+                    ]
+                
+                # Known (size, mtime) -> fingerprint per path, so unchanged
+                # files are not re-hashed on every run
+                fingerprint_cache = {
+                    path: (size, mtime, fingerprint)
+                    for path, size, mtime, fingerprint in db.query(
+                        FileFingerprint.path, FileFingerprint.size,
+                        FileFingerprint.mtime, FileFingerprint.fingerprint
+                    )
+                }
+                existing_fingerprints = set(db.scalars(select(DocumentModel.fingerprint)))
+                # Documents ingested before BLAKE3 carry bare SHA-256
+                # fingerprints and have no cache row to reuse
+                legacy_fingerprints = {
+                    fingerprint for fingerprint in existing_fingerprints
+                    if not fingerprint.startswith(BLAKE3_PREFIX)
+                }
+                new_documents = []
                 
-                for pdf_file in pdf_files:
-                    file_path = os.path.join(pdf_storage_path, pdf_file)
+                for entry in pdf_entries:
+                    pdf_file = entry.name
+                    file_path = entry.path
+                    st = entry.stat()
+                    
+                    cached = fingerprint_cache.get(file_path)
+                    if cached and cached[:2] == (st.st_size, st.st_mtime):
+                        fingerprint = cached[2]
+                    else:
+                        fingerprint = None
+                        if cached is None and legacy_fingerprints:
+                            legacy = _sha256_fingerprint(file_path)
+                            if legacy in legacy_fingerprints:
+                                fingerprint = legacy
+                        if fingerprint is None:
+                            fingerprint = _blake3_fingerprint(file_path)
+                        
+                        db.merge(FileFingerprint(
+                            path=file_path,
+                            size=st.st_size,
+                            mtime=st.st_mtime,
+                            fingerprint=fingerprint
+                        ))
                     
                     # Check if already in database
-                    with open(file_path, "rb") as f:
-                        content = f.read()
-                        fingerprint = hashlib.sha256(content).hexdigest()
+                    if fingerprint in existing_fingerprints:
+                        continue
+                    existing_fingerprints.add(fingerprint)
                     
-                    existing_doc = db.query(DocumentModel).filter(DocumentModel.fingerprint == fingerprint).first()
-                    if not existing_doc:
-                        # Add new PDF to database
-                        document = DocumentModel(
-                            title=self._extract_document_title(file_path),
-                            fingerprint=fingerprint,
-                            source_path=file_path
-                        )
-                        db.add(document)
-                        db.commit()
-                        db.refresh(document)
-                        self.logger.info("Added new PDF to database", filename=pdf_file, doc_id=document.id)
+                    # Add new PDF to database; the filename is a provisional
+                    # title until processing reads the first page
+                    document = DocumentModel(
+                        title=os.path.basename(file_path).replace('.pdf', ''),
+                        fingerprint=fingerprint,
+                        source_path=file_path
+                    )
+                    db.add(document)
+                    new_documents.append((pdf_file, document))
+                
+                # Write all new documents in one flush and a single commit
+                db.flush()
+                for pdf_file, document in new_documents:
+                    self.logger.info("Added new PDF to database", filename=pdf_file, doc_id=document.id)
+                    new_document_ids.add(document.id)
+                db.commit()
             
-            # Find documents without citations
-            unprocessed_docs = db.query(DocumentModel).filter(
-                ~DocumentModel.citations_from.any()
-            ).all()
+            # Find documents without citations (anti-join on from_doc_id)
+            unprocessed_docs = db.query(DocumentModel).outerjoin(
+                CitationModel, CitationModel.from_doc_id == DocumentModel.id
+            ).filter(CitationModel.id.is_(None)).order_by(DocumentModel.source_path, DocumentModel.id).all()
             
             results = []
-            for doc in unprocessed_docs:
-                try:
-                    result = self.process_document(doc.id)
-                    results.append(result)
-                except Exception as e:
-                    self.logger.error("Failed to process document", 
-                                    doc_id=doc.id, error=str(e))
-                    results.append({
-                        "document_id": doc.id,
-                        "processing_status": "failed",
-                        "error": str(e)
-                    })
+            if unprocessed_docs:
+                # Text extraction and citation parsing are CPU-bound and
+                # independent per document, so only they run in worker
+                # processes. Storing and linking stay here, one document at
+                # a time in a fixed order, so each document links against
+                # the same set of rows however the pool schedules the work
+                max_workers = min(_processing_workers(), len(unprocessed_docs))
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=WORKER_MP_CONTEXT) as executor:
+                    futures = [
+                        (doc, executor.submit(_extract_document_worker, doc.source_path,
+                                              doc.id in new_document_ids))
+                        for doc in unprocessed_docs
+                    ]
+                    for doc, future in futures:
+                        doc_id = doc.id
+                        try:
+                            results.append(self._store_document(db, doc, future.result()))
+                        except Exception as e:
+                            db.rollback()
+                            self.logger.error("Failed to process document", 
+                                            doc_id=doc_id, error=str(e))
+                            if doc_id in new_document_ids:
+                                self._replace_provisional_title(db, doc)
+                            results.append({
+                                "document_id": doc_id,
+                                "processing_status": "failed",
+                                "error": str(e)
+                            })
             
             summary = {
                 "total_documents": len(unprocessed_docs),
@@ -366,3 +551,30 @@ class DocumentProcessor:
         finally:
             db.close()
 
+def _processing_workers() -> int:
+    """Number of worker processes to use for CPU-bound extraction"""
+    return max(1, int(os.getenv("PROCESSING_WORKERS", os.cpu_count() or 1)))
+
+# Tags BLAKE3 fingerprints so they are never confused with the bare
+# SHA-256 hex digests stored by earlier versions
+BLAKE3_PREFIX = "blake3:"
+
+def _blake3_fingerprint(file_path: str) -> str:
+    """BLAKE3 over a memory map: multithreaded SIMD hashing without
+    copying the file through Python"""
+    hasher = blake3(max_threads=blake3.AUTO)
+    hasher.update_mmap(file_path)
+    return BLAKE3_PREFIX + hasher.hexdigest()
+
+def _sha256_fingerprint(file_path: str) -> str:
+    """Legacy SHA-256 fingerprint, used to recognise existing documents"""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def _extract_document_worker(source_path: str, extract_title: bool = False) -> Dict:
+    """Extract text and parse citations for one document inside a worker process"""
+    return DocumentProcessor()._extract_document(source_path, extract_title=extract_title)
+
+def _extract_title_worker(file_path: str) -> str:
+    """Extract a document title inside a worker process"""
+    return DocumentProcessor()._extract_document_title(file_path)
@@ -1,20 +1,24 @@
 """
 FastAPI main application following cursor/eng/api.contract.md
 """
-from fastapi import FastAPI, Depends, HTTPException, Query
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, selectinload
+from typing import Dict, List, Optional, Tuple
 import os
+import asyncio
 import hashlib
+import time
+import orjson
 import structlog
 
-from backend.database import get_db, create_tables
-from backend.models import Document as DocumentModel, Citation as CitationModel
+from backend.database import get_db, create_tables, warm_pool
+from backend.models import Document as DocumentModel, Citation as CitationModel, DataVersion
 from backend.schemas import (
     DocumentsResponse, DocumentDetailResponse, GraphResponse,
-    Document, Citation, GraphNode, GraphEdge
+    Document, Citation
 )
 from backend.document_processor import DocumentProcessor
 
@@ -25,7 +29,8 @@ logger = structlog.get_logger()
 app = FastAPI(
     title="Legal Citation Graph API",
     description="AI-assisted legal citation graph using eyecite",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
@@ -43,6 +48,8 @@ async def startup_event():
     create_tables()
     logger.info("Database tables created")
     
+    warm_pool()
+    
     # Automatically process existing PDFs in the data/pdfs folder
     await process_existing_pdfs()
 
@@ -54,8 +61,12 @@ async def process_existing_pdfs():
             logger.warning("PDF storage path does not exist", path=pdf_storage_path)
             return
         
-        # Find all PDF files
-        pdf_files = [f for f in os.listdir(pdf_storage_path) if f.lower().endswith('.pdf')]
+        # Find all PDF files; scandir reports file type without a stat per entry
+        with os.scandir(pdf_storage_path) as entries:
+            pdf_files = [
+                entry.name for entry in entries
+                if entry.is_file() and entry.name.lower().endswith('.pdf')
+            ]
         logger.info("Found existing PDFs", count=len(pdf_files))
         
         if not pdf_files:
@@ -76,45 +87,97 @@ async def process_existing_pdfs():
 # Health check
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {"status": "ok"}
 
 # API endpoints following cursor/eng/api.contract.md
 
+# Columns backing the document schema, selected explicitly so list
+# queries don't load ORM entities
+_DOCUMENT_COLUMNS = [getattr(DocumentModel, name) for name in Document.model_fields]
+
+def _construct(schema, obj):
+    """Build a response schema from a trusted ORM object without validation"""
+    return schema.model_construct(**{name: getattr(obj, name) for name in schema.model_fields})
+
+# Clients may keep read responses but must revalidate them via ETag
+_CACHE_CONTROL = "no-cache"
+
+def _data_version(db: Session) -> Optional[str]:
+    """Token replaced by every write to documents or citations, used for ETags"""
+    return db.scalar(select(DataVersion.version))
+
+def _make_etag(*parts) -> str:
+    """Weak ETag over the given version parts"""
+    digest = hashlib.blake2b("-".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of an ETag against the request's If-None-Match"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
 @app.get("/v1/documents", response_model=DocumentsResponse)
-async def get_documents(
+def get_documents(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """Get list of documents"""
-    documents = db.query(DocumentModel).offset(skip).limit(limit).all()
-    total = db.query(DocumentModel).count()
+    etag = _make_etag(_data_version(db), skip, limit)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
     
-    return DocumentsResponse(
-        items=[Document.model_validate(doc) for doc in documents],
+    documents = db.execute(
+        select(*_DOCUMENT_COLUMNS).offset(skip).limit(limit)
+    ).all()
+    # Plain count(*); Query.count() wraps a SELECT of every column
+    total = db.scalar(select(func.count()).select_from(DocumentModel))
+    
+    # Rows come straight from our own tables, so skip re-validation
+    return DocumentsResponse.model_construct(
+        items=[Document.model_construct(**doc._asdict()) for doc in documents],
         total=total
     )
 
 @app.get("/v1/documents/{doc_id}", response_model=DocumentDetailResponse)
-async def get_document_detail(
+def get_document_detail(
     doc_id: str,
     db: Session = Depends(get_db)
 ):
     """Get document with its citations"""
-    document = db.query(DocumentModel).filter(DocumentModel.id == doc_id).first()
+    # Citations arrive through one SELECT ... IN batch instead of a
+    # per-document lazy load
+    document = db.execute(
+        select(DocumentModel)
+        .where(DocumentModel.id == doc_id)
+        .options(selectinload(DocumentModel.citations_from))
+    ).scalar_one_or_none()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    citations = db.query(CitationModel).filter(CitationModel.from_doc_id == doc_id).all()
-    
-    return DocumentDetailResponse(
-        document=Document.model_validate(document),
-        citations=[Citation.model_validate(citation) for citation in citations]
+    return DocumentDetailResponse.model_construct(
+        document=_construct(Document, document),
+        citations=[_construct(Citation, citation) for citation in document.citations_from]
     )
 
+class PDFFileResponse(FileResponse):
+    """FileResponse reading 1MB per thread hop instead of Starlette's 64KB"""
+    chunk_size = 1024 * 1024
+
 @app.get("/v1/documents/{doc_id}/pdf")
-async def get_document_pdf(
+def get_document_pdf(
     doc_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Stream PDF bytes"""
@@ -125,54 +188,139 @@ async def get_document_pdf(
     if not os.path.exists(document.source_path):
         raise HTTPException(status_code=404, detail="PDF file not found on disk")
     
-    def iter_file(file_path: str):
-        with open(file_path, "rb") as file_like:
-            yield from file_like
+    stat = os.stat(document.source_path)
+    etag = f'W/"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     
-    return StreamingResponse(
-        iter_file(document.source_path),
+    # File reads run on a worker thread in large chunks instead of being
+    # copied through Python a line at a time
+    return PDFFileResponse(
+        document.source_path,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"inline; filename={os.path.basename(document.source_path)}"}
+        filename=os.path.basename(document.source_path),
+        content_disposition_type="inline",
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+        stat_result=stat
     )
 
+# Rows fetched per round trip while streaming the graph
+GRAPH_BATCH_SIZE = 1000
+
+# Serialized graph bodies keyed by ETag, so repeat requests skip the
+# queries entirely. The ETag is derived from the data version token, which
+# every write (from any process) replaces and which is never reissued after
+# a rollback, so a key can't map to stale data; endpoints that write also
+# clear the cache to drop dead entries. Bodies above the size cap are
+# streamed but not kept
+GRAPH_CACHE_TTL = 60
+GRAPH_CACHE_MAX_ENTRIES = 64
+GRAPH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_graph_cache: Dict[str, Tuple[float, bytes]] = {}
+
+def _get_cached_graph(etag: str) -> Optional[bytes]:
+    entry = _graph_cache.get(etag)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_graph(etag: str, body: bytes):
+    now = time.monotonic()
+    if len(_graph_cache) >= GRAPH_CACHE_MAX_ENTRIES:
+        for key, (expires, _) in list(_graph_cache.items()):
+            if expires <= now:
+                _graph_cache.pop(key, None)
+    if len(_graph_cache) >= GRAPH_CACHE_MAX_ENTRIES:
+        _graph_cache.pop(next(iter(_graph_cache), None), None)
+    _graph_cache[etag] = (now + GRAPH_CACHE_TTL, body)
+
 @app.get("/v1/graph", response_model=GraphResponse)
-async def get_citation_graph(
+def get_citation_graph(
+    request: Request,
     min_confidence: float = Query(0.7, ge=0.0, le=1.0),
     db: Session = Depends(get_db)
 ):
     """Get citation graph with confidence threshold"""
-    # Get all documents
-    documents = db.query(DocumentModel).all()
-    nodes = [
-        GraphNode(
-            id=doc.id,
-            label=doc.title,
-            meta={
-                "court": doc.court,
-                "year": doc.year,
-                "docket": doc.docket
-            }
-        )
-        for doc in documents
-    ]
+    etag = _make_etag(_data_version(db), min_confidence)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     
-    # Get citations above confidence threshold
-    citations = db.query(CitationModel).filter(
-        CitationModel.confidence >= min_confidence,
-        CitationModel.to_doc_id.isnot(None)
-    ).all()
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    body = _get_cached_graph(etag)
+    if body is not None:
+        return Response(body, media_type="application/json", headers=headers)
     
-    edges = [
-        GraphEdge(
-            id=citation.id,
-            source=citation.from_doc_id,
-            target=citation.to_doc_id,
-            confidence=citation.confidence
+    # Plain def so FastAPI runs the blocking queries in its threadpool
+    # instead of on the event loop. Rows are read from a server-side
+    # cursor and written out a batch at a time, so memory stays bounded
+    # however large the graph gets
+    def generate_graph():
+        documents = db.execute(
+            select(DocumentModel.id, DocumentModel.title, DocumentModel.court,
+                   DocumentModel.year, DocumentModel.docket)
+            .execution_options(yield_per=GRAPH_BATCH_SIZE)
+        )
+        yield b'{"nodes":['
+        separator = b""
+        for batch in documents.partitions():
+            # One orjson call per batch; the list brackets are sliced off
+            # so batches concatenate into a single JSON array
+            yield separator + orjson.dumps([
+                {
+                    "id": doc_id,
+                    "label": title,
+                    "meta": {
+                        "court": court,
+                        "year": year,
+                        "docket": docket
+                    }
+                }
+                for doc_id, title, court, year, docket in batch
+            ])[1:-1]
+            separator = b","
+        
+        # Get citations above confidence threshold
+        citations = db.execute(
+            select(CitationModel.id, CitationModel.from_doc_id,
+                   CitationModel.to_doc_id, CitationModel.confidence)
+            .where(CitationModel.confidence >= min_confidence,
+                   CitationModel.to_doc_id.isnot(None))
+            .execution_options(yield_per=GRAPH_BATCH_SIZE)
         )
-        for citation in citations
-    ]
+        yield b'],"edges":['
+        separator = b""
+        for batch in citations.partitions():
+            yield separator + orjson.dumps([
+                {
+                    "id": citation_id,
+                    "source": source,
+                    "target": target,
+                    "confidence": confidence
+                }
+                for citation_id, source, target, confidence in batch
+            ])[1:-1]
+            separator = b","
+        yield b"]}"
     
-    return GraphResponse(nodes=nodes, edges=edges)
+    def stream_and_cache():
+        chunks = []
+        size = 0
+        for chunk in generate_graph():
+            yield chunk
+            if chunks is not None:
+                size += len(chunk)
+                if size > GRAPH_CACHE_MAX_BYTES:
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+        if chunks is not None:
+            _cache_graph(etag, b"".join(chunks))
+    
+    return StreamingResponse(
+        stream_and_cache(),
+        media_type="application/json",
+        headers=headers
+    )
 
 # Upload endpoint removed - system now automatically processes existing PDFs
 
@@ -182,6 +330,7 @@ async def process_documents():
     processor = DocumentProcessor()
     try:
         result = processor.process_all_documents()
+        _graph_cache.clear()
         return result
     except Exception as e:
         logger.error("Document processing failed", error=str(e))
@@ -200,7 +349,8 @@ async def process_single_document(
     
     processor = DocumentProcessor()
     try:
-        result = processor.process_document(doc_id)
+        result = processor.process_document(doc_id, parallel_pages=True)
+        _graph_cache.clear()
         return result
     except Exception as e:
         logger.error("Document processing failed", doc_id=doc_id, error=str(e))
@@ -226,6 +376,7 @@ async def update_document_title(
         if new_title and new_title != document.title:
             document.title = new_title
             db.commit()
+            _graph_cache.clear()
             logger.info("Updated document title", doc_id=doc_id, old_title=document.title, new_title=new_title)
             return {"message": "Title updated", "old_title": document.title, "new_title": new_title}
         else:
@@ -240,20 +391,36 @@ async def update_all_document_titles(
     db: Session = Depends(get_db)
 ):
     """Update titles for all documents using improved extraction logic"""
-    documents = db.query(DocumentModel).all()
-    updated_count = 0
+    documents = db.execute(
+        select(DocumentModel.id, DocumentModel.title, DocumentModel.source_path)
+    ).all()
     
     try:
         processor = DocumentProcessor()
+        candidates = [
+            document for document in documents
+            if document.source_path and os.path.exists(document.source_path)
+        ]
         
-        for document in documents:
-            if document.source_path and os.path.exists(document.source_path):
-                new_title = processor._extract_document_title(document.source_path)
-                if new_title and new_title != document.title:
-                    document.title = new_title
-                    updated_count += 1
+        # Extraction is CPU-bound; run it in worker processes without
+        # holding up the event loop
+        loop = asyncio.get_running_loop()
+        new_titles = await loop.run_in_executor(
+            None, processor.extract_titles, [document.source_path for document in candidates]
+        )
         
+        updates = [
+            {"id": document.id, "title": new_title}
+            for document, new_title in zip(candidates, new_titles)
+            if new_title and new_title != document.title
+        ]
+        if updates:
+            db.execute(update(DocumentModel), updates)
         db.commit()
+        if updates:
+            _graph_cache.clear()
+        
+        updated_count = len(updates)
         logger.info("Updated document titles", updated_count=updated_count, total_documents=len(documents))
         return {"message": f"Updated {updated_count} out of {len(documents)} document titles"}
         
@@ -261,6 +428,10 @@ async def update_all_document_titles(
         logger.error("Failed to update document titles", error=str(e))
         raise HTTPException(status_code=500, detail=f"Title update failed: {str(e)}")
 
+# Build the OpenAPI schema once all routes are registered; FastAPI serves
+# /openapi.json and /docs from app.openapi_schema once it is set
+app.openapi_schema = app.openapi()
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("API_PORT", 8000))
@@ -1,20 +1,36 @@
 """
 Data models following cursor/eng/data.models.md specification
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Boolean, Index, bindparam, event, insert, text, update
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+import os
+import time
 from datetime import datetime
+from itertools import chain
 
 Base = declarative_base()
 
+def uuid7() -> str:
+    """Time-ordered UUIDv7 string, so new rows append to the end of the PK index"""
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76                          # version
+        | (rand >> 68) << 64                 # rand_a, 12 bits
+        | 0b10 << 62                         # RFC 4122 variant
+        | rand & 0x3FFFFFFFFFFFFFFF          # rand_b, 62 bits
+    )
+    hex_value = f"{value:032x}"
+    return f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}"
+
 class Document(Base):
     """Document model as specified in data.models.md"""
     __tablename__ = "documents"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=uuid7)
     title = Column(String, nullable=False)
     fingerprint = Column(String, nullable=False, unique=True)  # hash of content
     source_path = Column(String, nullable=True)  # local file path
@@ -25,15 +41,27 @@ class Document(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
-    citations_from = relationship("Citation", foreign_keys="Citation.from_doc_id", back_populates="from_document")
+    # Load explicitly (e.g. selectinload); an implicit lazy load raises
+    citations_from = relationship("Citation", foreign_keys="Citation.from_doc_id", back_populates="from_document", lazy="raise")
     citations_to = relationship("Citation", foreign_keys="Citation.to_doc_id", back_populates="to_document")
 
 class Citation(Base):
     """Citation model as specified in data.models.md"""
     __tablename__ = "citations"
+    __table_args__ = (
+        # Exact reporter/volume/page lookups during citation linking
+        Index("ix_citation_rvp", "reporter", "volume", "page"),
+        # Graph edges: confidence >= ? AND to_doc_id IS NOT NULL. Partial
+        # where supported, so unresolved citations stay out of the index
+        Index(
+            "ix_citation_resolved", "confidence", "to_doc_id",
+            postgresql_where=text("to_doc_id IS NOT NULL"),
+            sqlite_where=text("to_doc_id IS NOT NULL")
+        ),
+    )
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    from_doc_id = Column(String, ForeignKey("documents.id"), nullable=False)
+    id = Column(String, primary_key=True, default=uuid7)
+    from_doc_id = Column(String, ForeignKey("documents.id"), nullable=False, index=True)
     to_doc_id = Column(String, ForeignKey("documents.id"), nullable=True)  # nullable for unresolved citations
     
     # Citation text and normalization
@@ -61,3 +89,53 @@ class Citation(Base):
     from_document = relationship("Document", foreign_keys=[from_doc_id], back_populates="citations_from")
     to_document = relationship("Document", foreign_keys=[to_doc_id], back_populates="citations_to")
 
+class FileFingerprint(Base):
+    """Content hash cache for ingested files, keyed by path"""
+    __tablename__ = "file_fingerprints"
+    
+    path = Column(String, primary_key=True)
+    size = Column(Integer, nullable=False)
+    mtime = Column(Float, nullable=False)
+    fingerprint = Column(String, nullable=False)
+
+class DataVersion(Base):
+    """Single-row version token replaced by every write to documents or
+    citations, so readers can tell whether anything changed without
+    scanning tables"""
+    __tablename__ = "data_version"
+    
+    id = Column(Integer, primary_key=True)
+    # A fresh UUIDv7 per write rather than a counter: a rolled-back write
+    # restores the previous token, and a counter would then hand the same
+    # value to the next, different write
+    version = Column(String, nullable=False, default=uuid7)
+
+@event.listens_for(DataVersion.__table__, "after_create")
+def _seed_data_version(target, connection, **kw):
+    connection.execute(insert(target).values(id=1, version=uuid7()))
+
+_VERSIONED_MODELS = (Document, Citation)
+_BUMP_DATA_VERSION = (
+    update(DataVersion.__table__)
+    .where(DataVersion.__table__.c.id == 1)
+    .values(version=bindparam("version"))
+)
+
+def _bump_data_version(session: Session):
+    session.connection().execute(_BUMP_DATA_VERSION, {"version": uuid7()})
+
+@event.listens_for(Session, "after_flush")
+def _bump_data_version_on_flush(session, flush_context):
+    """Unit-of-work writes: added, modified or deleted documents and citations"""
+    if any(isinstance(obj, _VERSIONED_MODELS)
+           for obj in chain(session.new, session.dirty, session.deleted)):
+        _bump_data_version(session)
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_data_version_on_bulk_write(orm_execute_state):
+    """Bulk insert(), update() and delete() statements bypass the flush"""
+    state = orm_execute_state
+    if (state.is_insert or state.is_update or state.is_delete) and any(
+        mapper.class_ in _VERSIONED_MODELS for mapper in state.all_mappers
+    ):
+        _bump_data_version(state.session)
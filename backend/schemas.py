@@ -1,7 +1,7 @@
 """
 Pydantic schemas for API requests/responses following cursor/eng/api.contract.md
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 from datetime import datetime
 
@@ -22,8 +22,7 @@ class Document(DocumentBase):
     source_url: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
 
 # Citation schemas
 class CitationBase(BaseModel):
@@ -49,8 +48,7 @@ class Citation(CitationBase):
     to_doc_id: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
 
 # API response schemas following cursor/eng/api.contract.md
 class DocumentsResponse(BaseModel):
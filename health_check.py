@@ -4,10 +4,21 @@ Health Check Script for Legal Citation Graph
 This script provides simple verification that the system is working
 """
 import requests
+import threading
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session shared by all probes
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Checks run concurrently; each buffers its status lines here so the
+# report still prints in a fixed order
+_output = threading.local()
 
 def print_status(message, status="INFO"):
     """Print a formatted status message"""
@@ -18,13 +29,17 @@ def print_status(message, status="INFO"):
         "ERROR": "[FAIL]"
     }
     indicator = status_indicators.get(status, "[INFO]")
-    print(f"{indicator} {message}")
+    lines = getattr(_output, "lines", None)
+    if lines is not None:
+        lines.append(f"{indicator} {message}")
+    else:
+        print(f"{indicator} {message}")
 
 def check_backend_health(base_url="http://localhost:8000"):
     """Check if backend is healthy"""
     try:
         start_time = time.time()
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = _session.get(f"{base_url}/health", timeout=5)
         response_time = time.time() - start_time
         
         if response.status_code == 200:
@@ -61,16 +76,23 @@ def check_api_endpoints(base_url="http://localhost:8000"):
     success_count = 0
     total_count = len(endpoints)
     
-    for endpoint, name in endpoints:
+    def probe(endpoint):
         try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code in [200, 404]:  # 404 is okay for empty data
-                print_status(f"{name}: Accessible (HTTP {response.status_code})", "SUCCESS")
-                success_count += 1
-            else:
-                print_status(f"{name}: HTTP {response.status_code}", "WARNING")
+            return _session.get(f"{base_url}{endpoint}", timeout=5)
         except Exception as e:
-            print_status(f"{name}: Error - {e}", "ERROR")
+            return e
+    
+    with ThreadPoolExecutor(max_workers=total_count) as executor:
+        responses = list(executor.map(probe, [endpoint for endpoint, _ in endpoints]))
+    
+    for (endpoint, name), response in zip(endpoints, responses):
+        if isinstance(response, Exception):
+            print_status(f"{name}: Error - {response}", "ERROR")
+        elif response.status_code in [200, 404]:  # 404 is okay for empty data
+            print_status(f"{name}: Accessible (HTTP {response.status_code})", "SUCCESS")
+            success_count += 1
+        else:
+            print_status(f"{name}: HTTP {response.status_code}", "WARNING")
     
     print_status(f"API Endpoints: {success_count}/{total_count} accessible", 
                 "SUCCESS" if success_count == total_count else "WARNING")
@@ -79,7 +101,7 @@ def check_api_endpoints(base_url="http://localhost:8000"):
 def check_frontend_accessibility(base_url="http://localhost:3000"):
     """Check if frontend is accessible"""
     try:
-        response = requests.get(base_url, timeout=5)
+        response = _session.get(base_url, timeout=5)
         if response.status_code == 200:
             print_status("Frontend: Accessible", "SUCCESS")
             return True
@@ -148,25 +170,33 @@ def run_health_check():
     print("Legal Citation Graph Health Check")
     print("=" * 50)
     
-    # Check file structure
-    file_structure_ok = check_file_structure()
-    print()
-    
-    # Check Docker status
-    docker_ok = check_docker_status()
-    print()
-    
-    # Check backend
-    backend_ok = check_backend_health()
-    print()
+    # Run every check at once; wall time is the slowest probe rather
+    # than the sum of all timeouts
+    def run_buffered(check):
+        _output.lines = []
+        try:
+            return check(), _output.lines
+        finally:
+            _output.lines = None
+    
+    check_functions = [
+        check_file_structure,
+        check_docker_status,
+        check_backend_health,
+        check_api_endpoints,
+        check_frontend_accessibility
+    ]
+    with ThreadPoolExecutor(max_workers=len(check_functions)) as executor:
+        outcomes = list(executor.map(run_buffered, check_functions))
     
-    # Check API endpoints
-    api_ok = check_api_endpoints()
-    print()
+    for _, lines in outcomes:
+        for line in lines:
+            print(line)
+        print()
     
-    # Check frontend
-    frontend_ok = check_frontend_accessibility()
-    print()
+    (file_structure_ok, docker_ok, backend_ok, api_ok, frontend_ok) = (
+        ok for ok, _ in outcomes
+    )
     
     # Summary
     print("=" * 50)
@@ -6,10 +6,40 @@ Follows industry standard testing practices and provides detailed reporting
 import subprocess
 import sys
 import os
+import io
 import time
+import shlex
 import argparse
+import platform
+import contextlib
+from collections import defaultdict
+from importlib import metadata
 from pathlib import Path
 
+import pytest
+
+# pytest-xdist options: one worker per core, each test file kept on a
+# single worker so its session-scoped engine and client are built once
+XDIST_ARGS = ["-n", "auto", "--dist", "loadfile"]
+
+class CategoryCollector:
+    """pytest plugin tallying outcomes and durations per test file"""
+    
+    def __init__(self):
+        self.by_file = defaultdict(lambda: {"passed": 0, "failed": 0, "duration": 0.0})
+    
+    def pytest_runtest_logreport(self, report):
+        stats = self.by_file[report.nodeid.split("::")[0]]
+        stats["duration"] += report.duration
+        if report.failed:
+            stats["failed"] += 1
+        elif report.passed and report.when == "call":
+            stats["passed"] += 1
+    
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.by_file[report.nodeid.split("::")[0]]["failed"] += 1
+
 class TestRunner:
     """Industry standard test runner with comprehensive reporting"""
     
@@ -33,17 +63,19 @@ class TestRunner:
     def run_command(self, command, description, category):
         """Run a command and capture results"""
         print(f"\n[RUNNING] {description}")
-        print(f"Command: {command}")
+        print(f"Command: {shlex.join(command)}")
         
         start_time = time.time()
         try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            if command[0] == "pytest":
+                result = self.run_pytest(command[1:])
+            else:
+                result = subprocess.run(
+                    command, 
+                    capture_output=True, 
+                    text=True,
+                    timeout=300  # 5 minute timeout
+                )
             end_time = time.time()
             duration = end_time - start_time
             
@@ -99,11 +131,22 @@ class TestRunner:
             }
             return False
     
+    def run_pytest(self, args, plugins=None):
+        """Run pytest in this interpreter, capturing its terminal output"""
+        # Interpreter start-up, plugin loading and conftest imports are
+        # paid once instead of once per pytest subprocess
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            return_code = int(pytest.main(args, plugins=plugins or []))
+        return subprocess.CompletedProcess(
+            ["pytest", *args], return_code, stdout=output.getvalue(), stderr=""
+        )
+    
     def run_health_check(self):
         """Run system health check"""
         self.print_section("System Health Check")
         return self.run_command(
-            "python health_check.py",
+            [sys.executable, "health_check.py"],
             "System Health Check",
             "health_check"
         )
@@ -113,26 +156,59 @@ class TestRunner:
         self.print_section("Test Category Execution")
         
         test_categories = [
-            ("pytest tests/test_health.py -v --tb=short", "Health Check Tests", "health_tests"),
-            ("pytest tests/test_api_endpoints.py -v --tb=short", "API Endpoint Tests", "api_tests"),
-            ("pytest tests/test_models.py -v --tb=short", "Database Model Tests", "model_tests"),
-            ("pytest tests/test_citation_parser.py -v --tb=short", "Citation Parser Tests", "parser_tests"),
-            ("pytest tests/test_integration.py -v --tb=short", "Integration Tests", "integration_tests"),
-            ("pytest tests/test_frontend_components.py -v --tb=short", "Frontend Component Tests", "frontend_tests"),
+            ("tests/test_health.py", "Health Check Tests", "health_tests"),
+            ("tests/test_api_endpoints.py", "API Endpoint Tests", "api_tests"),
+            ("tests/test_models.py", "Database Model Tests", "model_tests"),
+            ("tests/test_citation_parser.py", "Citation Parser Tests", "parser_tests"),
+            ("tests/test_document_processor.py", "Document Processor Tests", "processor_tests"),
+            ("tests/test_integration.py", "Integration Tests", "integration_tests"),
+            ("tests/test_frontend_components.py", "Frontend Component Tests", "frontend_tests"),
         ]
         
+        # One collection pass over every category; outcomes are tallied per
+        # test file so each category is still reported on its own
+        collector = CategoryCollector()
+        args = [path for path, _, _ in test_categories] + XDIST_ARGS + ["-v", "--tb=short"]
+        command = ["pytest", *args]
+        print("\n[RUNNING] All test categories")
+        print(f"Command: {shlex.join(command)}")
+        try:
+            result = self.run_pytest(args, plugins=[collector])
+        except Exception as e:
+            result = subprocess.CompletedProcess(["pytest", *args], -1, stdout="", stderr=str(e))
+        
         results = []
-        for command, description, category in test_categories:
-            success = self.run_command(command, description, category)
+        for path, description, category in test_categories:
+            stats = collector.by_file[path]
+            success = result.returncode in (0, 1) and stats["failed"] == 0
+            self.results[category] = {
+                'success': success,
+                'duration': stats["duration"],
+                'return_code': 0 if success else (result.returncode or 1),
+                'stdout': '',
+                'stderr': result.stderr,
+                'command': command
+            }
+            status = "PASS" if success else "FAIL"
+            print(f"[{status}] {description}: {stats['passed']} passed, {stats['failed']} failed "
+                  f"in {stats['duration']:.2f}s")
             results.append((category, success))
         
+        if result.stdout.strip():
+            print("Output:")
+            print(result.stdout.strip())
+        if result.stderr.strip():
+            print("Error Output:")
+            print(result.stderr.strip())
+        
         return results
     
     def run_full_test_suite(self):
         """Run complete test suite"""
         self.print_section("Complete Test Suite")
         return self.run_command(
-            "pytest tests/ -v --tb=short --junitxml=test-results.xml --html=test-results.html --self-contained-html",
+            ["pytest", "tests/", *XDIST_ARGS, "-v", "--tb=short", "--junitxml=test-results.xml",
+             "--html=test-results.html", "--self-contained-html"],
             "Complete Test Suite with Reports",
             "full_suite"
         )
@@ -141,7 +217,7 @@ class TestRunner:
         """Run tests with specific markers"""
         self.print_section(f"Tests with '{marker}' marker")
         return self.run_command(
-            f"pytest tests/ -m {marker} -v --tb=short",
+            ["pytest", "tests/", "-m", marker, *XDIST_ARGS, "-v", "--tb=short"],
             f"Tests marked '{marker}'",
             f"marked_{marker}"
         )
@@ -205,8 +281,7 @@ class TestRunner:
         elif args.category:
             self.run_test_categories()
         else:
-            # Run full test suite
-            self.run_test_categories()
+            # The full suite already covers every category
             self.run_full_test_suite()
         
         self.end_time = time.time()
@@ -225,26 +300,12 @@ class TestRunner:
         self.print_section("Prerequisites Check")
         
         # Check Python
-        try:
-            result = subprocess.run(["python", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"[PASS] Python: {result.stdout.strip()}")
-            else:
-                print("[FAIL] Python not available")
-                return False
-        except Exception:
-            print("[FAIL] Python not available")
-            return False
+        print(f"[PASS] Python: Python {platform.python_version()} ({sys.executable})")
         
         # Check pytest
         try:
-            result = subprocess.run(["pytest", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"[PASS] pytest: {result.stdout.strip()}")
-            else:
-                print("[FAIL] pytest not available")
-                return False
-        except Exception:
+            print(f"[PASS] pytest: pytest {metadata.version('pytest')}")
+        except metadata.PackageNotFoundError:
             print("[FAIL] pytest not available")
             return False
         
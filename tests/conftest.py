@@ -1,49 +1,149 @@
+import threading
 import pytest
-import tempfile
-import os
+import pytest_asyncio
+import httpx
+import orjson
+import jsonschema
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from backend.database import get_db
-from backend.main import app
+from backend.main import app, _graph_cache
 from backend.models import Base
 
-@pytest.fixture
-def test_db():
-    """Create a temporary test database"""
-    # Create temporary database file
-    db_fd, db_path = tempfile.mkstemp()
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory test database once per run"""
+    # One shared connection keeps the in-memory database alive across sessions
+    test_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINT rollbacks are honoured;
+    # pysqlite otherwise defers and autocommits around them
+    @event.listens_for(test_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
     
-    # Create test database engine
-    test_engine = create_engine(f"sqlite:///{db_path}")
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+    @event.listens_for(test_engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
     
     # Create tables
     Base.metadata.create_all(bind=test_engine)
     
+    yield test_engine
+    
+    test_engine.dispose()
+
+@pytest.fixture
+def db_session(db_engine):
+    """Session wrapped in a transaction that is rolled back after each test"""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    # Commits made by the app only release a savepoint inside the outer transaction
+    session = Session(bind=connection, autoflush=False,
+                      join_transaction_mode="create_savepoint")
+    
+    # Concurrent requests (async_client) take turns on the shared session
+    session_lock = threading.Lock()
+    
     def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
+        with session_lock:
+            yield session
     
     # Override dependency
     app.dependency_overrides[get_db] = override_get_db
     
-    yield test_engine
+    yield session
     
     # Cleanup
     app.dependency_overrides.clear()
-    os.close(db_fd)
-    os.unlink(db_path)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+@pytest.fixture(autouse=True)
+def clear_graph_cache():
+    """Start and end every test with an empty /v1/graph body cache"""
+    _graph_cache.clear()
+    yield
+    _graph_cache.clear()
+
+@pytest.fixture(scope="session")
+def session_client():
+    """Single TestClient shared by the whole run"""
+    return TestClient(app)
 
 @pytest.fixture
-def client(test_db):
+def client(db_session, session_client):
     """Create test client with test database"""
-    return TestClient(app)
+    return session_client
+
+@pytest_asyncio.fixture
+async def async_client(db_session):
+    """Async client driving the ASGI app in-process, for concurrent requests"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        yield async_client
+
+@pytest.fixture(scope="session")
+def executor():
+    """Thread pool shared by the concurrent-request tests"""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
+
+# Response shapes shared by the API consistency tests
+_DOCUMENTS_SCHEMA = {
+    "type": "object",
+    "required": ["items", "total"],
+    "properties": {
+        "items": {"type": "array"},
+        "total": {"type": "integer"}
+    }
+}
+
+_GRAPH_SCHEMA = {
+    "type": "object",
+    "required": ["nodes", "edges"],
+    "properties": {
+        "nodes": {"type": "array"},
+        "edges": {"type": "array"}
+    }
+}
+
+_OPENAPI_SCHEMA = {
+    "type": "object",
+    "required": ["openapi", "info", "paths"]
+}
+
+@pytest.fixture(scope="session")
+def documents_validator():
+    """Validator for /v1/documents responses, compiled once"""
+    return jsonschema.Draft202012Validator(_DOCUMENTS_SCHEMA)
+
+@pytest.fixture(scope="session")
+def graph_validator():
+    """Validator for /v1/graph responses, compiled once"""
+    return jsonschema.Draft202012Validator(_GRAPH_SCHEMA)
+
+@pytest.fixture(scope="session")
+def openapi_validator():
+    """Validator for the top level of the OpenAPI schema, compiled once"""
+    return jsonschema.Draft202012Validator(_OPENAPI_SCHEMA)
+
+@pytest.fixture
+def json_body():
+    """Decode a response body straight from bytes with orjson"""
+    def decode(response):
+        return orjson.loads(response.content)
+    return decode
 
 @pytest.fixture
 def sample_pdf_content():
@@ -6,15 +6,24 @@ Run this script to execute all tests with clear output
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 def run_command(command, description):
-    """Run a command and return success status"""
+    """Run a command and return its result (or the exception raised)"""
+    try:
+        return subprocess.run(command, capture_output=True, text=True)
+    except Exception as e:
+        return e
+
+def report_result(result, description):
+    """Print a command's result and return success status"""
     print(f"\n{'='*60}")
     print(f"TESTING: {description}")
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        if isinstance(result, Exception):
+            raise result
         
         if result.returncode == 0:
             print("[PASS] SUCCESS")
@@ -58,30 +67,28 @@ def main():
     
     # Test categories
     test_categories = [
-        ("pytest tests/test_health.py -v", "Health Check Tests"),
-        ("pytest tests/test_api_endpoints.py -v", "API Endpoint Tests"),
-        ("pytest tests/test_models.py -v", "Database Model Tests"),
-        ("pytest tests/test_citation_parser.py -v", "Citation Parser Tests"),
-        ("pytest tests/test_integration.py -v", "Integration Tests"),
-        ("pytest tests/test_frontend_components.py -v", "Frontend Component Tests"),
+        (["pytest", "tests/test_health.py", "-v"], "Health Check Tests"),
+        (["pytest", "tests/test_api_endpoints.py", "-v"], "API Endpoint Tests"),
+        (["pytest", "tests/test_models.py", "-v"], "Database Model Tests"),
+        (["pytest", "tests/test_citation_parser.py", "-v"], "Citation Parser Tests"),
+        (["pytest", "tests/test_document_processor.py", "-v"], "Document Processor Tests"),
+        (["pytest", "tests/test_integration.py", "-v"], "Integration Tests"),
+        (["pytest", "tests/test_frontend_components.py", "-v"], "Frontend Component Tests"),
     ]
     
-    # Run each test category
-    for command, description in test_categories:
+    # Categories are independent pytest processes: run them side by side,
+    # then report in order. Together they cover the whole suite, so it
+    # is not run a second time
+    with ThreadPoolExecutor(max_workers=len(test_categories)) as executor:
+        results = list(executor.map(
+            lambda category: run_command(*category), test_categories
+        ))
+    
+    for (command, description), result in zip(test_categories, results):
         total_tests += 1
-        if run_command(command, description):
+        if report_result(result, description):
             success_count += 1
     
-    # Run all tests together
-    print(f"\n{'='*60}")
-    print("RUNNING: Complete Test Suite")
-    print(f"{'='*60}")
-    
-    all_tests_success = run_command("pytest tests/ -v", "Complete Test Suite")
-    if all_tests_success:
-        success_count += 1
-    total_tests += 1
-    
     # Summary
     print(f"\n{'='*60}")
     print("TEST SUMMARY")
@@ -1,6 +1,8 @@
 """
 API Endpoint Tests - Test all API endpoints with simple verification
 """
+import asyncio
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from backend.models import Document, Citation
@@ -9,29 +11,14 @@ from sqlalchemy.orm import Session
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
-def test_documents_endpoint_returns_empty_list_when_no_documents(client: TestClient):
+def test_documents_endpoint_returns_empty_list_when_no_documents(client: TestClient, json_body):
     """Test that documents endpoint returns empty list when no documents exist"""
     response = client.get("/v1/documents")
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["items"] == []
     assert data["total"] == 0
 
-@pytest.mark.api
-@pytest.mark.integration
-@pytest.mark.fast
-def test_documents_endpoint_returns_correct_structure(client: TestClient):
-    """Test that documents endpoint returns correct JSON structure"""
-    response = client.get("/v1/documents")
-    assert response.status_code == 200
-    data = response.json()
-    
-    # Check required fields exist
-    assert "items" in data
-    assert "total" in data
-    assert isinstance(data["items"], list)
-    assert isinstance(data["total"], int)
-
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
@@ -46,29 +33,14 @@ def test_documents_endpoint_handles_pagination(client: TestClient):
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
-def test_graph_endpoint_returns_empty_graph_when_no_data(client: TestClient):
+def test_graph_endpoint_returns_empty_graph_when_no_data(client: TestClient, json_body):
     """Test that graph endpoint returns empty graph when no data exists"""
     response = client.get("/v1/graph")
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["nodes"] == []
     assert data["edges"] == []
 
-@pytest.mark.api
-@pytest.mark.integration
-@pytest.mark.fast
-def test_graph_endpoint_returns_correct_structure(client: TestClient):
-    """Test that graph endpoint returns correct JSON structure"""
-    response = client.get("/v1/graph")
-    assert response.status_code == 200
-    data = response.json()
-    
-    # Check required fields exist
-    assert "nodes" in data
-    assert "edges" in data
-    assert isinstance(data["nodes"], list)
-    assert isinstance(data["edges"], list)
-
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
@@ -100,17 +72,80 @@ def test_process_endpoint_returns_response(client: TestClient):
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
-def test_api_docs_accessible(client: TestClient):
-    """Test that API documentation is accessible"""
-    response = client.get("/docs")
+@pytest.mark.asyncio
+async def test_read_only_endpoints_concurrently(async_client: httpx.AsyncClient, json_body):
+    """Test the read-only endpoints' structure with the requests issued together"""
+    documents, graph, docs, openapi = await asyncio.gather(
+        async_client.get("/v1/documents"),
+        async_client.get("/v1/graph"),
+        async_client.get("/docs"),
+        async_client.get("/openapi.json")
+    )
+    
+    # Documents: check required fields exist
+    assert documents.status_code == 200
+    data = json_body(documents)
+    assert "items" in data
+    assert "total" in data
+    assert isinstance(data["items"], list)
+    assert isinstance(data["total"], int)
+    
+    # Graph: check required fields exist
+    assert graph.status_code == 200
+    data = json_body(graph)
+    assert "nodes" in data
+    assert "edges" in data
+    assert isinstance(data["nodes"], list)
+    assert isinstance(data["edges"], list)
+    
+    # API documentation is accessible
+    assert docs.status_code == 200
+    assert "text/html" in docs.headers["content-type"]
+    
+    assert openapi.status_code == 200
+    assert openapi.headers["content-type"] == "application/json"
+
+@pytest.mark.api
+@pytest.mark.integration
+@pytest.mark.fast
+def test_documents_endpoint_revalidates_with_etag(client: TestClient, db_session: Session,
+                                                  test_document_data):
+    """Test that a matching If-None-Match gets a 304 until the data changes"""
+    document = Document(**test_document_data)
+    db_session.add(document)
+    db_session.commit()
+    
+    response = client.get("/v1/documents")
+    etag = response.headers["ETag"]
+    
+    response = client.get("/v1/documents", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    
+    # An in-place update must invalidate the ETag
+    document.title = document.title.swapcase()
+    db_session.commit()
+    
+    response = client.get("/v1/documents", headers={"If-None-Match": etag})
     assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
+    assert response.headers["ETag"] != etag
 
 @pytest.mark.api
 @pytest.mark.integration
 @pytest.mark.fast
-def test_openapi_schema_accessible(client: TestClient):
-    """Test that OpenAPI schema is accessible"""
-    response = client.get("/openapi.json")
+def test_graph_etag_not_reused_after_rollback(client: TestClient, db_session: Session, json_body):
+    """Test that a rolled-back write's ETag is never served for later data"""
+    db_session.add(Document(title="Alpha", fingerprint="fp-alpha"))
+    db_session.flush()
+    response = client.get("/v1/graph")
+    rolled_back_etag = response.headers["ETag"]
+    assert [node["label"] for node in json_body(response)["nodes"]] == ["Alpha"]
+    db_session.rollback()
+    
+    db_session.add(Document(title="Beta", fingerprint="fp-beta"))
+    db_session.commit()
+    
+    response = client.get("/v1/graph", headers={"If-None-Match": rolled_back_etag})
     assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
+    assert response.headers["ETag"] != rolled_back_etag
+    assert [node["label"] for node in json_body(response)["nodes"]] == ["Beta"]
@@ -118,6 +118,20 @@ def test_citation_span_positions():
     assert isinstance(citation["span_start"], int)
     assert isinstance(citation["span_end"], int)
 
+@pytest.mark.unit
+@pytest.mark.fast
+def test_parse_citations_batch_matches_single_parses():
+    """Test that batch parsing returns one result per text, duplicates included"""
+    parser = CitationParser()
+    texts = ["410 U.S. 113", "No citations here.", "410 U.S. 113", "123 F.2d 456"]
+    
+    results = parser.parse_citations_batch(texts)
+    
+    assert len(results) == len(texts)
+    for text, citations in zip(texts, results):
+        assert [c.raw_text for c in citations] == [c.raw_text for c in parser.parse_citations(text)]
+    assert results[0] is not results[2]
+
 @pytest.mark.unit
 @pytest.mark.fast
 def test_parser_handles_edge_cases():
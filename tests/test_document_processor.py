@@ -0,0 +1,138 @@
+"""
+Document Processor Tests - Test citation linking against the test database
+"""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from backend.document_processor import DocumentProcessor
+from backend.models import Document, Citation
+
+def _document(db_session: Session, name: str) -> Document:
+    document = Document(title=name, fingerprint=f"fp-{name}")
+    db_session.add(document)
+    db_session.flush()
+    return document
+
+def _citation(db_session: Session, document: Document, volume: int, page,
+              reporter: str = "U.S.", confidence: float = 0.5) -> Citation:
+    citation = Citation(
+        from_doc_id=document.id,
+        raw_text=f"{volume} {reporter} {page}",
+        normalized_key=f"{reporter}_{volume}_{page}",
+        reporter=reporter,
+        volume=volume,
+        page=page,
+        confidence=confidence,
+        resolution_notes="[]"
+    )
+    db_session.add(citation)
+    db_session.flush()
+    return citation
+
+def _links_from(db_session: Session, document: Document):
+    return db_session.execute(
+        select(Citation.to_doc_id, Citation.confidence)
+        .where(Citation.from_doc_id == document.id, Citation.to_doc_id.is_not(None))
+    ).all()
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_exact_match(db_session: Session):
+    """Test that a single document citing the same case becomes the link target"""
+    citing, other = _document(db_session, "citing"), _document(db_session, "other")
+    _citation(db_session, other, 410, 113)
+    citation = _citation(db_session, citing, 410, 113)
+
+    linked = DocumentProcessor()._link_citations(db_session, [citation])
+
+    assert linked == 1
+    assert citation.to_doc_id == other.id
+    assert citation.confidence == pytest.approx(0.8)
+    assert "Exact reporter/volume/page match" in citation.resolution_notes
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_multiple_candidates(db_session: Session):
+    """Test that every candidate gets a link row plus a primary link"""
+    citing = _document(db_session, "citing")
+    first, second = _document(db_session, "first"), _document(db_session, "second")
+    _citation(db_session, first, 410, 113)
+    _citation(db_session, second, 410, 113)
+    citation = _citation(db_session, citing, 410, 113)
+
+    linked = DocumentProcessor()._link_citations(db_session, [citation])
+
+    # One queued row per candidate, then the primary link on the citation
+    assert linked == 3
+    assert citation.to_doc_id in (first.id, second.id)
+    assert citation.confidence == pytest.approx(0.3)
+    links = _links_from(db_session, citing)
+    assert sorted(to_doc_id for to_doc_id, _ in links) == sorted([first.id, second.id, citation.to_doc_id])
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_suppresses_duplicate_rows(db_session: Session):
+    """Test that repeated citations of one case queue each link row once"""
+    citing = _document(db_session, "citing")
+    first, second = _document(db_session, "first"), _document(db_session, "second")
+    _citation(db_session, first, 410, 113)
+    _citation(db_session, second, 410, 113)
+    citations = [_citation(db_session, citing, 410, 113), _citation(db_session, citing, 410, 113)]
+
+    DocumentProcessor()._link_citations(db_session, citations)
+
+    queued = db_session.scalars(
+        select(Citation.to_doc_id)
+        .where(Citation.from_doc_id == citing.id,
+               Citation.resolution_notes.like('%network connection%'))
+    ).all()
+    assert sorted(queued) == sorted([first.id, second.id])
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_fuzzy_within_ten_volumes(db_session: Session):
+    """Test that fuzzy matching only reaches documents within 10 volumes"""
+    citing = _document(db_session, "citing")
+    near, far = _document(db_session, "near"), _document(db_session, "far")
+    other_reporter = _document(db_session, "other-reporter")
+    _citation(db_session, near, 400, 1)
+    _citation(db_session, far, 421, 1)
+    _citation(db_session, other_reporter, 410, 1, reporter="F.")
+    citation = _citation(db_session, citing, 410, 113)
+
+    linked = DocumentProcessor()._link_citations(db_session, [citation])
+
+    assert linked == 1
+    assert citation.to_doc_id is None
+    assert _links_from(db_session, citing) == [(near.id, pytest.approx(0.3))]
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_excludes_self(db_session: Session):
+    """Test that a document's own citations never make it a link target"""
+    citing = _document(db_session, "citing")
+    _citation(db_session, citing, 408, 1)
+    citation = _citation(db_session, citing, 410, 113)
+
+    linked = DocumentProcessor()._link_citations(db_session, [citation])
+
+    assert linked == 0
+    assert citation.to_doc_id is None
+    assert _links_from(db_session, citing) == []
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.fast
+def test_link_skips_incomplete_citations(db_session: Session):
+    """Test that citations without a page are not linked"""
+    citing, other = _document(db_session, "citing"), _document(db_session, "other")
+    _citation(db_session, other, 410, None)
+    citation = _citation(db_session, citing, 410, None)
+
+    assert DocumentProcessor()._link_citations(db_session, [citation]) == 0
+    assert citation.to_doc_id is None
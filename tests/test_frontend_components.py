@@ -3,16 +3,59 @@ Frontend Component Tests - Test React components with simple verification
 """
 import pytest
 from unittest.mock import Mock, patch
-import sys
 import os
+import json
+import mmap
+from functools import lru_cache
 
-# Add frontend to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'frontend'))
+FRONTEND_DIR = os.path.join(os.path.dirname(__file__), '..', 'frontend')
+
+# Dependency and build output trees are never probed by these tests
+_SKIPPED_DIRS = {'node_modules', '.next'}
+
+def _scan_tree(root, prefix=""):
+    """Collect relative paths below root with one scandir per directory"""
+    paths = set()
+    with os.scandir(root) as entries:
+        for entry in entries:
+            path = prefix + entry.name
+            paths.add(path)
+            if entry.is_dir(follow_symlinks=False) and entry.name not in _SKIPPED_DIRS:
+                paths.update(_scan_tree(entry.path, path + "/"))
+    return paths
+
+@lru_cache(maxsize=1)
+def _package_json(path):
+    """Parse package.json once per run"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _find_tokens(path, tokens):
+    """Map each token to whether it occurs in the file, via mmap find"""
+    # find() stops at the first hit and the file is never decoded to str
+    with open(path, 'rb') as f:
+        # mmap can't map an empty file, and an empty file holds no tokens
+        if os.fstat(f.fileno()).st_size == 0:
+            return {token: False for token in tokens}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return {token: content.find(token.encode()) != -1 for token in tokens}
+
+@pytest.fixture
+def frontend_on_path(monkeypatch):
+    """Add frontend to sys.path for the duration of one test"""
+    monkeypatch.syspath_prepend(FRONTEND_DIR)
+
+@pytest.fixture(scope="session")
+def frontend_tree():
+    """Snapshot of the frontend tree as a set of relative paths"""
+    if not os.path.isdir(FRONTEND_DIR):
+        return frozenset()
+    return frozenset(_scan_tree(FRONTEND_DIR))
 
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_citation_graph_component_import():
+def test_citation_graph_component_import(frontend_on_path):
     """Test that CitationGraph component can be imported"""
     try:
         from frontend.src.components.CitationGraph import CitationGraph
@@ -24,7 +67,7 @@ def test_citation_graph_component_import():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_api_client_functions_exist():
+def test_api_client_functions_exist(frontend_on_path):
     """Test that API client functions are defined"""
     try:
         from frontend.src.lib.api import (
@@ -46,17 +89,14 @@ def test_api_client_functions_exist():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_frontend_pages_exist():
+def test_frontend_pages_exist(frontend_tree):
     """Test that frontend pages are accessible"""
-    frontend_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend', 'src', 'app')
-    
-    if os.path.exists(frontend_dir):
+    if 'src/app' in frontend_tree:
         # Check for key pages
         expected_pages = ['page.tsx', 'upload/page.tsx', 'documents/page.tsx', 'graph/page.tsx']
         
         for page in expected_pages:
-            page_path = os.path.join(frontend_dir, page)
-            if os.path.exists(page_path):
+            if f'src/app/{page}' in frontend_tree:
                 assert True  # Page exists
             else:
                 pytest.skip(f"Page {page} not found")
@@ -66,17 +106,14 @@ def test_frontend_pages_exist():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_frontend_configuration():
+def test_frontend_configuration(frontend_tree):
     """Test that frontend configuration files exist"""
-    frontend_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend')
-    
-    if os.path.exists(frontend_dir):
+    if frontend_tree:
         # Check for key config files
         config_files = ['package.json', 'next.config.js', 'tailwind.config.js']
         
         for config in config_files:
-            config_path = os.path.join(frontend_dir, config)
-            if os.path.exists(config_path):
+            if config in frontend_tree:
                 assert True  # Config file exists
             else:
                 pytest.skip(f"Config file {config} not found")
@@ -86,17 +123,11 @@ def test_frontend_configuration():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_frontend_dependencies():
+def test_frontend_dependencies(frontend_tree):
     """Test that frontend dependencies are properly configured"""
-    frontend_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend')
-    
-    if os.path.exists(frontend_dir):
-        package_json_path = os.path.join(frontend_dir, 'package.json')
-        
-        if os.path.exists(package_json_path):
-            import json
-            with open(package_json_path, 'r') as f:
-                package_data = json.load(f)
+    if frontend_tree:
+        if 'package.json' in frontend_tree:
+            package_data = _package_json(os.path.join(FRONTEND_DIR, 'package.json'))
             
             # Check for required dependencies
             required_deps = ['react', 'next', 'react-dom']
@@ -113,22 +144,18 @@ def test_frontend_dependencies():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_frontend_build_configuration():
+def test_frontend_build_configuration(frontend_tree):
     """Test that frontend build configuration is correct"""
-    frontend_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend')
-    
-    if os.path.exists(frontend_dir):
-        next_config_path = os.path.join(frontend_dir, 'next.config.js')
-        
-        if os.path.exists(next_config_path):
+    if frontend_tree:
+        if 'next.config.js' in frontend_tree:
             # Check that next.config.js exists and is readable
-            with open(next_config_path, 'r') as f:
-                config_content = f.read()
+            found = _find_tokens(os.path.join(FRONTEND_DIR, 'next.config.js'),
+                                 ('reactStrictMode', 'output', 'standalone'))
             
             # Check for key configurations
-            assert 'reactStrictMode' in config_content
-            assert 'output' in config_content
-            assert 'standalone' in config_content
+            assert found['reactStrictMode']
+            assert found['output']
+            assert found['standalone']
         else:
             pytest.skip("next.config.js not found")
     else:
@@ -137,21 +164,17 @@ def test_frontend_build_configuration():
 @pytest.mark.frontend
 @pytest.mark.unit
 @pytest.mark.fast
-def test_frontend_styling_configuration():
+def test_frontend_styling_configuration(frontend_tree):
     """Test that frontend styling configuration is correct"""
-    frontend_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend')
-    
-    if os.path.exists(frontend_dir):
-        tailwind_config_path = os.path.join(frontend_dir, 'tailwind.config.js')
-        
-        if os.path.exists(tailwind_config_path):
+    if frontend_tree:
+        if 'tailwind.config.js' in frontend_tree:
             # Check that tailwind.config.js exists and is readable
-            with open(tailwind_config_path, 'r') as f:
-                config_content = f.read()
+            found = _find_tokens(os.path.join(FRONTEND_DIR, 'tailwind.config.js'),
+                                 ('content', 'theme'))
             
             # Check for key configurations
-            assert 'content' in config_content
-            assert 'theme' in config_content
+            assert found['content']
+            assert found['theme']
         else:
             pytest.skip("tailwind.config.js not found")
     else:
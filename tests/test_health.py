@@ -27,12 +27,12 @@ def test_health_endpoint_returns_json(client: TestClient):
 def test_health_endpoint_fast_response(client: TestClient):
     """Test that health endpoint responds quickly"""
     import time
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     response = client.get("/health")
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
     
     assert response.status_code == 200
-    assert (end_time - start_time) < 1.0  # Should respond in under 1 second
+    assert (end_time - start_time) < 1_000_000_000  # Should respond in under 1 second
 
 @pytest.mark.health
 @pytest.mark.smoke
@@ -43,22 +43,22 @@ def test_health_endpoint_consistent_response(client: TestClient):
     response2 = client.get("/health")
     response3 = client.get("/health")
     
-    assert response1.json() == response2.json() == response3.json() == {"status": "ok"}
+    # Compare raw bytes; test_health_endpoint_always_works covers JSON decoding
+    assert response1.content == response2.content == response3.content == b'{"status":"ok"}'
 
 @pytest.mark.health
 @pytest.mark.smoke
 @pytest.mark.fast
-def test_health_endpoint_handles_multiple_requests(client: TestClient):
+def test_health_endpoint_handles_multiple_requests(client: TestClient, executor):
     """Test that health endpoint can handle multiple simultaneous requests"""
     import concurrent.futures
     
     def make_request():
         return client.get("/health")
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(make_request) for _ in range(5)]
-        responses = [future.result() for future in futures]
+    futures = [executor.submit(make_request) for _ in range(5)]
     
-    for response in responses:
+    for future in concurrent.futures.as_completed(futures):
+        response = future.result()
         assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+        assert response.content == b'{"status":"ok"}'
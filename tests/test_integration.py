@@ -31,25 +31,17 @@ def test_complete_document_workflow(client: TestClient):
 @pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.fast
-def test_api_endpoints_consistency(client: TestClient):
+def test_api_endpoints_consistency(client: TestClient, documents_validator, graph_validator):
     """Test that API endpoints return consistent data structures"""
     # Test documents endpoint structure
     response = client.get("/v1/documents")
     assert response.status_code == 200
-    data = response.json()
-    assert "items" in data
-    assert "total" in data
-    assert isinstance(data["items"], list)
-    assert isinstance(data["total"], int)
+    documents_validator.validate(response.json())
     
     # Test graph endpoint structure
     response = client.get("/v1/graph")
     assert response.status_code == 200
-    data = response.json()
-    assert "nodes" in data
-    assert "edges" in data
-    assert isinstance(data["nodes"], list)
-    assert isinstance(data["edges"], list)
+    graph_validator.validate(response.json())
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -81,76 +73,57 @@ def test_api_response_headers(client: TestClient):
 @pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.fast
-def test_api_pagination_consistency(client: TestClient):
+@pytest.mark.parametrize("skip,limit", [(0, 10), (10, 5), (0, 100), (100, 10)])
+def test_api_pagination_consistency(client: TestClient, documents_validator, skip, limit):
     """Test that pagination works consistently"""
-    # Test different pagination parameters
-    pagination_tests = [
-        {"skip": 0, "limit": 10},
-        {"skip": 10, "limit": 5},
-        {"skip": 0, "limit": 100},
-        {"skip": 100, "limit": 10}
-    ]
-    
-    for params in pagination_tests:
-        response = client.get("/v1/documents", params=params)
-        assert response.status_code == 200
-        data = response.json()
-        assert "items" in data
-        assert "total" in data
+    response = client.get("/v1/documents", params={"skip": skip, "limit": limit})
+    assert response.status_code == 200
+    documents_validator.validate(response.json())
 
 @pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.fast
-def test_graph_filtering_consistency(client: TestClient):
+@pytest.mark.parametrize("confidence", [0.0, 0.5, 0.7, 0.9, 1.0])
+def test_graph_filtering_consistency(client: TestClient, graph_validator, confidence):
     """Test that graph filtering works consistently"""
-    # Test different confidence levels
-    confidence_levels = [0.0, 0.5, 0.7, 0.9, 1.0]
-    
-    for confidence in confidence_levels:
-        response = client.get(f"/v1/graph?min_confidence={confidence}")
-        assert response.status_code == 200
-        data = response.json()
-        assert "nodes" in data
-        assert "edges" in data
+    response = client.get(f"/v1/graph?min_confidence={confidence}")
+    assert response.status_code == 200
+    graph_validator.validate(response.json())
 
 @pytest.mark.integration
 @pytest.mark.health
 @pytest.mark.slow
-def test_health_endpoint_under_load(client: TestClient):
+def test_health_endpoint_under_load(client: TestClient, executor):
     """Test that health endpoint works under load"""
     import concurrent.futures
     import time
     
     def make_health_request():
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         response = client.get("/health")
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         return response.status_code, (end_time - start_time)
     
     # Make multiple concurrent requests
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(make_health_request) for _ in range(20)]
-        results = [future.result() for future in futures]
+    futures = [executor.submit(make_health_request) for _ in range(20)]
     
     # All requests should succeed
-    for status_code, response_time in results:
+    for future in concurrent.futures.as_completed(futures):
+        status_code, response_time = future.result()
         assert status_code == 200
-        assert response_time < 2.0  # Should respond in under 2 seconds
+        assert response_time < 2_000_000_000  # Should respond in under 2 seconds
 
 @pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.fast
-def test_api_documentation_consistency(client: TestClient):
+def test_api_documentation_consistency(client: TestClient, openapi_validator):
     """Test that API documentation is consistent"""
     # Test OpenAPI schema
     response = client.get("/openapi.json")
     assert response.status_code == 200
-    schema = response.json()
     
     # Check required OpenAPI fields
-    assert "openapi" in schema
-    assert "info" in schema
-    assert "paths" in schema
+    openapi_validator.validate(response.json())
     
     # Test Swagger UI
     response = client.get("/docs")
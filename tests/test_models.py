@@ -4,8 +4,6 @@ Database Model Tests - Test data models and relationships
 import pytest
 from sqlalchemy.orm import Session
 from backend.models import Document, Citation, Base
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 @pytest.mark.unit
 @pytest.mark.database
@@ -137,3 +135,33 @@ def test_model_defaults():
     assert document.processed == 0
     assert citation.confidence == 0.0
     assert document.created_at is not None
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.fast
+def test_models_persist_with_defaults(db_session: Session):
+    """Test that models round-trip through the shared test database with defaults applied"""
+    document = Document(
+        title="Test Document",
+        fingerprint="test_fingerprint_123",
+        source_path="/test/path/document.pdf"
+    )
+    db_session.add(document)
+    db_session.flush()
+    
+    citation = Citation(
+        from_doc_id=document.id,
+        raw_text="410 U.S. 113 (1973)",
+        normalized_key="US_410_113_1973"
+    )
+    db_session.add(citation)
+    db_session.flush()
+    
+    # Column defaults are filled in on flush
+    assert document.id is not None
+    assert document.created_at is not None
+    assert citation.id is not None
+    assert citation.confidence == 0.0
+    
+    stored = db_session.get(Citation, citation.id)
+    assert stored.from_document is document